@@ -13,6 +13,7 @@ import tarfile
 import zipfile
 from argparse import ArgumentParser
 from datetime import datetime
+from itertools import islice
 from typing import Dict, List, Optional
 
 import aiofiles
@@ -94,7 +95,7 @@ def _detect_platform_from_data(data: ChatCollection) -> str:
         return "unknown"
 
     # Sample a few chats to detect platform characteristics
-    sample_chats = list(data.values())[:5]  # Check first 5 chats
+    sample_chats = islice(data.values(), 5)  # Check first 5 chats
 
     ios_indicators = 0
     android_indicators = 0
@@ -115,7 +116,7 @@ def _detect_platform_from_data(data: ChatCollection) -> str:
                 android_indicators += 2
 
         # Check message structure for platform-specific patterns
-        sample_messages = list(chat.values())[:3]  # Check first 3 messages per chat
+        sample_messages = islice(chat.values(), 3)  # Check first 3 messages per chat
         for message in sample_messages:
             # iOS messages tend to have different timestamp patterns
             if hasattr(message, "timestamp") and message.timestamp:
@@ -15,13 +15,13 @@ from rich.progress import track
 
 from Whatsapp_Chat_Exporter.data_model import ChatStore, Message
 from Whatsapp_Chat_Exporter.utility import (
-    CURRENT_TZ_OFFSET,
     MAX_SIZE,
     ROW_SIZE,
     Device,
     JidType,
     bytes_to_readable,
     convert_time_unit,
+    current_tz_offset,
     determine_metadata,
     get_chat_condition,
     get_cond_for_empty,
@@ -427,7 +427,7 @@ def _process_single_message(data, content, table_message, timezone_offset):
         timestamp=content["timestamp"],
         time=content["timestamp"],
         key_id=content["key_id"],
-        timezone_offset=timezone_offset if timezone_offset else CURRENT_TZ_OFFSET,
+        timezone_offset=timezone_offset if timezone_offset else current_tz_offset(),
         message_type=content["media_wa_type"],
         received_timestamp=content["received_timestamp"],
         read_timestamp=content["read_timestamp"],
@@ -1146,7 +1146,7 @@ def _process_call_record(content, chat, data, timezone_offset):
         timestamp=content["timestamp"],
         time=content["timestamp"],
         key_id=content["call_id"],
-        timezone_offset=timezone_offset if timezone_offset else CURRENT_TZ_OFFSET,
+        timezone_offset=timezone_offset if timezone_offset else current_tz_offset(),
         received_timestamp=content["timestamp"],
         read_timestamp=(content["timestamp"] + content.get("duration", 0)),
     )
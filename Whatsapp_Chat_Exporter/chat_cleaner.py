@@ -23,10 +23,12 @@ import re
 import shutil
 import sys
 import time
+from concurrent.futures import Future, ProcessPoolExecutor
 from dataclasses import asdict, dataclass, field
 from datetime import datetime
+from functools import lru_cache
 from pathlib import Path
-from typing import Dict, List, Optional, Set
+from typing import Dict, FrozenSet, List, Optional, Set, Tuple
 
 try:
     from bs4 import BeautifulSoup
@@ -43,6 +45,91 @@ except ImportError:
     PSUTIL_AVAILABLE = False
 
 
+# Patterns used for every message are compiled once at import time
+_PHONE_PATTERN = re.compile(r"\+?[\d\s\-\(\)]{10,}")
+_EMAIL_PATTERN = re.compile(r"\b[A-Za-z0-9._%+-]+@[A-Za-z0-9.-]+\.[A-Z|a-z]{2,}\b")
+# Class of the elements holding messages in HTML exports
+_HTML_MESSAGE_CLASS_PATTERN = re.compile(r"message|msg")
+# Tried in order to find a timestamp in HTML message text
+_HTML_TIME_PATTERNS = [
+    re.compile(r"(\d{1,2}:\d{2}(?::\d{2})?(?:\s*[AP]M)?)"),
+    re.compile(r"(\d{1,2}/\d{1,2}/\d{2,4})"),
+    re.compile(r"(\d{4}-\d{2}-\d{2})"),
+]
+# WhatsApp text export line: [date, time] sender: message
+_TEXT_LINE_PATTERN = re.compile(
+    r"\[?(\d{1,2}/\d{1,2}/\d{2,4}),?\s*(\d{1,2}:\d{2}(?::\d{2})?(?:\s*[AP]M)?)\]?\s*([^:]+):\s*(.*)"
+)
+_WHITESPACE_PATTERN = re.compile(r"\s+")
+# Placeholders left behind for media that was not exported, as one
+# alternation so a message is scanned once; the group name tells which
+# placeholder matched
+_MEDIA_PLACEHOLDER_PATTERN = re.compile(
+    r"(?P<omitted><Media omitted>)"
+    r"|(?P<media>\[Media file not available\])"
+    r"|(?P<image>\[Image not available\])"
+    r"|(?P<video>\[Video not available\])"
+    r"|(?P<audio>\[Audio not available\])"
+    r"|(?P<document>\[Document not available\])",
+    re.IGNORECASE,
+)
+# Formats tried in order; the first one that parses wins
+_HTML_TIMESTAMP_FORMATS = ("%H:%M", "%I:%M %p", "%m/%d/%Y", "%Y-%m-%d")
+_TEXT_TIMESTAMP_FORMATS = ("%m/%d/%Y %H:%M", "%m/%d/%Y %I:%M %p", "%d/%m/%Y %H:%M")
+
+
+@lru_cache(maxsize=4096)
+def _parse_timestamp(value: str, formats: Tuple[str, ...]) -> Optional[datetime]:
+    """Parse value with the first matching format, or return None.
+
+    Messages sent in the same minute share a timestamp string, so results
+    are cached; each miss costs a strptime call and a ValueError per format.
+    """
+    for fmt in formats:
+        try:
+            return datetime.strptime(value, fmt)
+        except ValueError:
+            continue
+    return None
+
+
+@lru_cache(maxsize=32)
+def _compile_system_patterns(patterns: Tuple[str, ...]) -> Tuple[re.Pattern, ...]:
+    """Compile system message patterns, fused into one regex where possible.
+
+    A single alternation scans each message once instead of once per pattern.
+    Patterns with groups are kept separate, since fusing them would renumber
+    their backreferences. Results are cached because a cleaner is built for
+    every file parsed in a worker process.
+    """
+    compiled = tuple(re.compile(pattern, re.IGNORECASE) for pattern in patterns)
+    if len(compiled) < 2 or any(pattern.groups for pattern in compiled):
+        return compiled
+    try:
+        fused = re.compile(
+            "|".join(f"(?:{pattern})" for pattern in patterns), re.IGNORECASE
+        )
+    except re.error:
+        # e.g. inline global flags, which are only valid at the start
+        return compiled
+    return (fused,)
+
+
+@lru_cache(maxsize=1024)
+def _similarity_key(content: str) -> Tuple[str, FrozenSet[str]]:
+    """Return normalized content and its character set.
+
+    Each message is compared with up to ten recent ones while removing
+    duplicates, so caching avoids renormalizing the same content each time.
+    """
+    normalized = _WHITESPACE_PATTERN.sub(" ", content.lower().strip())
+    return normalized, frozenset(normalized)
+
+
+# Lowercase substrings that mark an HTML message as media
+_MEDIA_INDICATORS = ("<media omitted>", "image", "video", "audio", "document")
+
+
 @dataclass
 class CleaningStats:
     """Statistics for cleaning operations."""
@@ -120,9 +207,15 @@ class CleaningConfig:
     # Performance
     batch_size: int = 1000
     max_memory_mb: int = 512
+    workers: int = 1  # Processes used to parse files in clean_directory
+    # BeautifulSoup tree builder for HTML input. "lxml" is much faster but
+    # must be installed, and it nests unclosed tags differently, so messages
+    # from malformed HTML can split differently than with "html.parser".
+    html_parser: str = "html.parser"
 
 
-@dataclass
+# One instance per message, so slots drop the per-instance __dict__
+@dataclass(slots=True)
 class MessageData:
     """Structured message data for processing."""
 
@@ -131,7 +224,6 @@ class MessageData:
     content: str
     message_type: str = "text"  # text, system, media
     media_path: Optional[str] = None
-    original_html: str = ""
     hash_content: str = ""  # For duplicate detection
 
     def __post_init__(self):
@@ -160,16 +252,13 @@ class ChatCleaner:
         self.email_counter = 1
 
         # Compiled patterns for performance
-        self.system_patterns = [
-            re.compile(pattern, re.IGNORECASE)
-            for pattern in self.config.system_message_patterns
-        ]
+        self.system_patterns = _compile_system_patterns(
+            tuple(self.config.system_message_patterns)
+        )
 
         # Privacy patterns
-        self.phone_pattern = re.compile(r"\+?[\d\s\-\(\)]{10,}")
-        self.email_pattern = re.compile(
-            r"\b[A-Za-z0-9._%+-]+@[A-Za-z0-9.-]+\.[A-Z|a-z]{2,}\b"
-        )
+        self.phone_pattern = _PHONE_PATTERN
+        self.email_pattern = _EMAIL_PATTERN
 
     def setup_logging(self):
         """Setup logging configuration."""
@@ -182,6 +271,15 @@ class ChatCleaner:
 
     def clean_file(self, input_path: str, output_path: Optional[str] = None) -> bool:
         """Clean a single chat file."""
+        return self._clean_file(input_path, output_path)
+
+    def _clean_file(
+        self,
+        input_path: str,
+        output_path: Optional[str] = None,
+        parsed: Optional[Future] = None,
+    ) -> bool:
+        """Clean a single chat file, optionally using a parse done in a worker."""
         start_time = time.time()
 
         try:
@@ -192,14 +290,14 @@ class ChatCleaner:
 
             # Determine output path
             if output_path is None:
-                output_path = self._generate_output_path(input_path)
+                output_path = self._generate_output_path(input_file)
 
             # Create backup if requested
             if self.config.create_backup:
-                self._create_backup(input_path)
+                self._create_backup(input_file)
 
             # Process the file
-            success = self._process_chat_file(input_path, output_path)
+            success = self._process_chat_file(input_path, output_path, parsed)
 
             self.stats.processing_time = time.time() - start_time
             self.stats.files_processed += 1
@@ -237,12 +335,37 @@ class ChatCleaner:
             output_path = Path(output_dir)
             output_path.mkdir(exist_ok=True)
 
-            # Process files
+            # Process files. Parsing is independent per file and CPU-bound, so
+            # it can run in worker processes; cleaning stays in this process
+            # because the anonymization map is shared across files.
             success_count = 0
-            for chat_file in chat_files:
-                output_file = output_path / f"cleaned_{chat_file.name}"
-                if self.clean_file(str(chat_file), str(output_file)):
-                    success_count += 1
+            executor = None
+            parsed: Dict[Path, Future] = {}
+            to_submit = iter(chat_files)
+            if self.config.workers > 1 and len(chat_files) > 1:
+                executor = ProcessPoolExecutor(max_workers=self.config.workers)
+            try:
+                for chat_file in chat_files:
+                    # A finished parse holds all of a file's messages in this
+                    # process until it is cleaned, so only parse a few ahead
+                    while (
+                        executor is not None and len(parsed) < 2 * self.config.workers
+                    ):
+                        next_file = next(to_submit, None)
+                        if next_file is None:
+                            break
+                        parsed[next_file] = executor.submit(
+                            _parse_chat_file_in_worker, self.config, str(next_file)
+                        )
+
+                    output_file = output_path / f"cleaned_{chat_file.name}"
+                    if self._clean_file(
+                        str(chat_file), str(output_file), parsed.pop(chat_file, None)
+                    ):
+                        success_count += 1
+            finally:
+                if executor is not None:
+                    executor.shutdown(cancel_futures=True)
 
             self.logger.info(
                 f"Successfully processed {success_count}/{len(chat_files)} files"
@@ -253,20 +376,18 @@ class ChatCleaner:
             self.logger.error(f"Error cleaning directory {input_dir}: {e}")
             return False
 
-    def _process_chat_file(self, input_path: str, output_path: str) -> bool:
+    def _process_chat_file(
+        self, input_path: str, output_path: str, parsed: Optional[Future] = None
+    ) -> bool:
         """Process a single chat file with all cleaning operations."""
         try:
-            # Detect file format and parse
             file_ext = Path(input_path).suffix.lower()
-
-            if file_ext in [".html", ".htm"]:
-                messages = self._parse_html_chat(input_path)
-            elif file_ext == ".json":
-                messages = self._parse_json_chat(input_path)
-            elif file_ext == ".txt":
-                messages = self._parse_text_chat(input_path)
+            if parsed is not None:
+                messages, warnings = parsed.result()
+                self.stats.warnings.extend(warnings)
             else:
-                self.logger.error(f"Unsupported file format: {file_ext}")
+                messages = self._parse_chat_file(input_path)
+            if messages is None:
                 return False
 
             if not messages:
@@ -290,6 +411,20 @@ class ChatCleaner:
             self.stats.errors.append(f"Processing {input_path}: {str(e)}")
             return False
 
+    def _parse_chat_file(self, input_path: str) -> Optional[List[MessageData]]:
+        """Detect the file format and parse it; None if it is unsupported."""
+        file_ext = Path(input_path).suffix.lower()
+
+        if file_ext in [".html", ".htm"]:
+            return self._parse_html_chat(input_path)
+        elif file_ext == ".json":
+            return self._parse_json_chat(input_path)
+        elif file_ext == ".txt":
+            return self._parse_text_chat(input_path)
+        else:
+            self.logger.error(f"Unsupported file format: {file_ext}")
+            return None
+
     def _parse_html_chat(self, file_path: str) -> List[MessageData]:
         """Parse HTML chat export."""
         if not BS4_AVAILABLE:
@@ -300,14 +435,14 @@ class ChatCleaner:
         messages = []
 
         try:
+            # Hand the file to BeautifulSoup so the raw markup is not kept
+            # alive alongside the tree while messages are extracted
             with open(file_path, "r", encoding="utf-8") as f:
-                content = f.read()
-
-            soup = BeautifulSoup(content, "html.parser")
+                soup = BeautifulSoup(f, self.config.html_parser)
 
             # Try different HTML structures
             message_elements = (
-                soup.find_all("div", class_=re.compile(r"message|msg"))
+                soup.find_all("div", class_=_HTML_MESSAGE_CLASS_PATTERN)
                 or soup.find_all("div", attrs={"data-testid": "msg"})
                 or soup.find_all("div", class_="chat-message")
                 or soup.find_all("p")  # Fallback
@@ -339,27 +474,16 @@ class ChatCleaner:
             # This is a simplified parser - would need adaptation for specific formats
 
             # Look for time patterns
-            time_patterns = [
-                r"(\d{1,2}:\d{2}(?::\d{2})?(?:\s*[AP]M)?)",
-                r"(\d{1,2}/\d{1,2}/\d{2,4})",
-                r"(\d{4}-\d{2}-\d{2})",
-            ]
-
             timestamp = datetime.now()  # Default
-            for pattern in time_patterns:
-                time_match = re.search(pattern, text_content)
+            for pattern in _HTML_TIME_PATTERNS:
+                time_match = pattern.search(text_content)
                 if time_match:
-                    try:
-                        time_str = time_match.group(1)
-                        # Try to parse different time formats
-                        for fmt in ["%H:%M", "%I:%M %p", "%m/%d/%Y", "%Y-%m-%d"]:
-                            try:
-                                timestamp = datetime.strptime(time_str, fmt)
-                                break
-                            except ValueError:
-                                continue
-                    except:
-                        pass
+                    # Try to parse different time formats
+                    parsed = _parse_timestamp(
+                        time_match.group(1), _HTML_TIMESTAMP_FORMATS
+                    )
+                    if parsed is not None:
+                        timestamp = parsed
                     break
 
             # Extract sender and content
@@ -375,24 +499,16 @@ class ChatCleaner:
             message_type = "text"
             if any(pattern.search(content) for pattern in self.system_patterns):
                 message_type = "system"
-            elif any(
-                media_indicator in content.lower()
-                for media_indicator in [
-                    "<Media omitted>",
-                    "image",
-                    "video",
-                    "audio",
-                    "document",
-                ]
-            ):
-                message_type = "media"
+            else:
+                content_lower = content.lower()
+                if any(indicator in content_lower for indicator in _MEDIA_INDICATORS):
+                    message_type = "media"
 
             return MessageData(
                 timestamp=timestamp,
                 sender=sender,
                 content=content,
                 message_type=message_type,
-                original_html=str(element),
             )
 
         except Exception as e:
@@ -441,52 +557,39 @@ class ChatCleaner:
         messages = []
 
         try:
+            # Iterate the file lazily so only one line is held in memory at a time
             with open(file_path, "r", encoding="utf-8") as f:
-                lines = f.readlines()
+                for line in f:
+                    line = line.strip()
+                    if not line:
+                        continue
 
-            for line in lines:
-                line = line.strip()
-                if not line:
-                    continue
-
-                # Try to parse WhatsApp text format: [date, time] sender: message
-                match = re.match(
-                    r"\[?(\d{1,2}/\d{1,2}/\d{2,4}),?\s*(\d{1,2}:\d{2}(?::\d{2})?(?:\s*[AP]M)?)\]?\s*([^:]+):\s*(.*)",
-                    line,
-                )
+                    # Try to parse WhatsApp text format: [date, time] sender: message
+                    match = _TEXT_LINE_PATTERN.match(line)
 
-                if match:
-                    date_str, time_str, sender, content = match.groups()
+                    if match:
+                        date_str, time_str, sender, content = match.groups()
 
-                    try:
                         # Combine date and time
-                        datetime_str = f"{date_str} {time_str}"
-                        for fmt in [
-                            "%m/%d/%Y %H:%M",
-                            "%m/%d/%Y %I:%M %p",
-                            "%d/%m/%Y %H:%M",
-                        ]:
-                            try:
-                                timestamp = datetime.strptime(datetime_str, fmt)
-                                break
-                            except ValueError:
-                                continue
-                        else:
+                        timestamp = _parse_timestamp(
+                            f"{date_str} {time_str}", _TEXT_TIMESTAMP_FORMATS
+                        )
+                        if timestamp is None:
                             timestamp = datetime.now()
-                    except:
-                        timestamp = datetime.now()
-
-                    message_type = "text"
-                    if any(pattern.search(content) for pattern in self.system_patterns):
-                        message_type = "system"
-
-                    message = MessageData(
-                        timestamp=timestamp,
-                        sender=sender.strip(),
-                        content=content.strip(),
-                        message_type=message_type,
-                    )
-                    messages.append(message)
+
+                        message_type = "text"
+                        if any(
+                            pattern.search(content) for pattern in self.system_patterns
+                        ):
+                            message_type = "system"
+
+                        message = MessageData(
+                            timestamp=timestamp,
+                            sender=sender.strip(),
+                            content=content.strip(),
+                            message_type=message_type,
+                        )
+                        messages.append(message)
 
         except Exception as e:
             self.logger.error(f"Error parsing text file {file_path}: {e}")
@@ -498,7 +601,8 @@ class ChatCleaner:
         self, messages: List[MessageData]
     ) -> List[MessageData]:
         """Apply all configured cleaning operations to messages."""
-        cleaned_messages = messages.copy()
+        # Every filtering step below builds a new list, so no copy is needed
+        cleaned_messages = messages
 
         self.logger.info("Applying cleaning operations...")
 
@@ -541,8 +645,9 @@ class ChatCleaner:
         seen_exact = set()
 
         for message in sorted_messages:
-            # Check for exact duplicates first
-            exact_key = f"{message.sender}:{message.content}:{message.timestamp}"
+            # Check for exact duplicates first; a tuple key hashes the existing
+            # objects instead of formatting the timestamp into a new string
+            exact_key = (message.sender, message.content, message.timestamp)
             if exact_key in seen_exact:
                 self.stats.duplicates_removed += 1
                 continue
@@ -584,21 +689,19 @@ class ChatCleaner:
             return False
 
         # Normalize content
-        norm1 = re.sub(r"\s+", " ", content1.lower().strip())
-        norm2 = re.sub(r"\s+", " ", content2.lower().strip())
+        norm1, set1 = _similarity_key(content1)
+        norm2, set2 = _similarity_key(content2)
 
         if norm1 == norm2:
             return True
 
         # Check character overlap
-        set1 = set(norm1)
-        set2 = set(norm2)
+        union = set1 | set2
 
-        if len(set1.union(set2)) == 0:
+        if not union:
             return False
 
-        overlap = len(set1.intersection(set2))
-        similarity = overlap / len(set1.union(set2))
+        similarity = len(set1 & set2) / len(union)
 
         return similarity >= similarity_threshold
 
@@ -668,22 +771,22 @@ class ChatCleaner:
                         message.content = f"{message.content} [Media file not found]"
                         self.stats.media_references_cleaned += 1
 
-            # Clean broken media references in content
-            media_patterns = [
-                r"<Media omitted>",
-                r"\[Media file not available\]",
-                r"\[Image not available\]",
-                r"\[Video not available\]",
-                r"\[Audio not available\]",
-                r"\[Document not available\]",
-            ]
-
-            for pattern in media_patterns:
-                if re.search(pattern, message.content, re.IGNORECASE):
-                    message.content = re.sub(
-                        pattern, "[Media]", message.content, flags=re.IGNORECASE
-                    )
-                    self.stats.media_references_cleaned += 1
+            # Every placeholder starts with "<" or "[", so most messages can
+            # skip the case-insensitive scan entirely
+            if "[" not in message.content and "<" not in message.content:
+                continue
+
+            # Clean broken media references in content, counting each kind
+            # of placeholder once per message
+            found = {
+                match.lastgroup
+                for match in _MEDIA_PLACEHOLDER_PATTERN.finditer(message.content)
+            }
+            if found:
+                message.content = _MEDIA_PLACEHOLDER_PATTERN.sub(
+                    "[Media]", message.content
+                )
+                self.stats.media_references_cleaned += len(found)
 
         self.logger.info(
             f"Cleaned {self.stats.media_references_cleaned} media references"
@@ -756,6 +859,10 @@ class ChatCleaner:
 
     def _anonymize_emails(self, content: str) -> str:
         """Anonymize email addresses in content."""
+        # The pattern cannot match without an "@", and on long runs of
+        # dot-separated words it backtracks quadratically, so skip the scan
+        if "@" not in content:
+            return content
 
         def replace_email(match):
             email = match.group(0)
@@ -861,7 +968,15 @@ class ChatCleaner:
                 f.write(f"# Total messages: {len(messages)}\n\n")
 
                 for message in messages:
-                    timestamp_str = message.timestamp.strftime("%m/%d/%Y, %H:%M")
+                    # Same output as strftime("%m/%d/%Y, %H:%M"), about 4x faster
+                    ts = message.timestamp
+                    timestamp_str = "%02d/%02d/%d, %02d:%02d" % (
+                        ts.month,
+                        ts.day,
+                        ts.year,
+                        ts.hour,
+                        ts.minute,
+                    )
                     f.write(f"[{timestamp_str}] {message.sender}: {message.content}\n")
 
             self.logger.info(f"Saved cleaned chat as text: {output_path}")
@@ -942,19 +1057,17 @@ class ChatCleaner:
             .replace("'", "&#x27;")
         )
 
-    def _generate_output_path(self, input_path: str) -> str:
+    def _generate_output_path(self, input_file: Path) -> str:
         """Generate output path for cleaned file."""
-        input_file = Path(input_path)
-        return str(input_file.parent / f"cleaned_{input_file.name}")
+        return str(input_file.with_name(f"cleaned_{input_file.name}"))
 
-    def _create_backup(self, file_path: str) -> None:
+    def _create_backup(self, input_file: Path) -> None:
         """Create backup of original file."""
         try:
-            input_file = Path(file_path)
-            backup_path = (
-                input_file.parent / f"{input_file.stem}_backup{input_file.suffix}"
+            backup_path = input_file.with_name(
+                f"{input_file.stem}_backup{input_file.suffix}"
             )
-            shutil.copy2(file_path, backup_path)
+            shutil.copy2(input_file, backup_path)
             self.logger.info(f"Backup created: {backup_path}")
         except Exception as e:
             self.logger.warning(f"Failed to create backup: {e}")
@@ -997,6 +1110,18 @@ class ChatCleaner:
         print("=" * 60)
 
 
+def _parse_chat_file_in_worker(
+    config: CleaningConfig, input_path: str
+) -> Tuple[Optional[List[MessageData]], List[str]]:
+    """Parse one chat file in a worker process for ChatCleaner.clean_directory.
+
+    The parse warnings are returned with the messages because the worker's
+    own stats are discarded.
+    """
+    cleaner = ChatCleaner(config)
+    return cleaner._parse_chat_file(input_path), cleaner.stats.warnings
+
+
 def create_default_config() -> CleaningConfig:
     """Create default cleaning configuration."""
     return CleaningConfig()
@@ -1139,6 +1264,19 @@ Supported Formats:
         default=512,
         help="Maximum memory usage in MB (default: 512)",
     )
+    parser.add_argument(
+        "--workers",
+        type=int,
+        default=1,
+        help="Processes used to parse files when cleaning a directory (default: 1)",
+    )
+    parser.add_argument(
+        "--html-parser",
+        choices=["html.parser", "lxml"],
+        default="html.parser",
+        help="BeautifulSoup parser for HTML input; lxml is faster but must be "
+        "installed and may split malformed HTML differently (default: html.parser)",
+    )
 
     # Output options
     parser.add_argument(
@@ -1208,6 +1346,8 @@ Supported Formats:
         output_format=args.output_format,
         batch_size=args.batch_size,
         max_memory_mb=args.max_memory,
+        workers=args.workers,
+        html_parser=args.html_parser,
     )
 
     # Initialize cleaner
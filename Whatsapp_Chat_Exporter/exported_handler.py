@@ -83,16 +83,20 @@ def messages(path, data, assume_first_as_me=False, prompt_user=False):
         False  # Flag to track if user identification has been done
     )
 
-    # Process the file while also counting the total lines for progress
+    # Process the file while also counting the total lines for progress.
+    # Counting is a full extra pass, so skip it when the bar is not shown.
+    show_progress = sys.stdout.isatty()
     with open(path, "r", encoding="utf8") as file:
-        total_row_number = sum(1 for _ in file)
-        file.seek(0)
+        total_row_number = None
+        if show_progress:
+            total_row_number = sum(1 for _ in file)
+            file.seek(0)
         for index, line in track(
             enumerate(file),
             total=total_row_number,
             description="Processing messages & media",
             transient=True,
-            disable=not sys.stdout.isatty(),
+            disable=not show_progress,
         ):
             you, user_identification_done = process_line(
                 line,
@@ -14,10 +14,10 @@ from rich.progress import track
 from Whatsapp_Chat_Exporter.data_model import ChatStore, Message
 from Whatsapp_Chat_Exporter.utility import (
     APPLE_TIME,
-    CURRENT_TZ_OFFSET,
     Device,
     bytes_to_readable,
     convert_time_unit,
+    current_tz_offset,
     get_chat_condition,
     is_group_jid,
     slugify,
@@ -445,7 +445,7 @@ def messages(
             time=ts,
             key_id=key_id,
             timezone_offset=int(
-                timezone_offset if timezone_offset else CURRENT_TZ_OFFSET
+                timezone_offset if timezone_offset else current_tz_offset()
             ),
             message_type=content["ZMESSAGETYPE"] if content["ZMESSAGETYPE"] else 0,
             received_timestamp=int(
@@ -1331,7 +1331,9 @@ def process_call_record(content, chat, data, timezone_offset):
             if "ZCALLIDSTRING" in content and content["ZCALLIDSTRING"]
             else hash(str(ts))
         ),
-        timezone_offset=int(timezone_offset if timezone_offset else CURRENT_TZ_OFFSET),
+        timezone_offset=int(
+            timezone_offset if timezone_offset else current_tz_offset()
+        ),
         message_type=0,
         received_timestamp=int(ts),
         read_timestamp=int(ts),
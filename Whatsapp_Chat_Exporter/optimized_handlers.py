@@ -156,7 +156,7 @@ class OptimizedAndroidHandler:
         # Process message using original logic but with pre-fetched data
         # Import Message class for creating message objects
         from Whatsapp_Chat_Exporter.data_model import Message
-        from Whatsapp_Chat_Exporter.utility import CURRENT_TZ_OFFSET
+        from Whatsapp_Chat_Exporter.utility import current_tz_offset
 
         # Create message object
         try:
@@ -167,7 +167,7 @@ class OptimizedAndroidHandler:
                 key_id=row.get("_id", 0),
                 received_timestamp=row.get("received_timestamp", 0),
                 read_timestamp=row.get("read_timestamp", 0),
-                timezone_offset=CURRENT_TZ_OFFSET,
+                timezone_offset=current_tz_offset(),
                 message_type=row.get("message_type"),
             )
 
@@ -395,7 +395,7 @@ class OptimizedIOSHandler:
         from Whatsapp_Chat_Exporter.data_model import Message
         from Whatsapp_Chat_Exporter.utility import (
             APPLE_TIME,
-            CURRENT_TZ_OFFSET,
+            current_tz_offset,
             is_group_jid,
         )
 
@@ -432,7 +432,7 @@ class OptimizedIOSHandler:
             key_id=key_id,
             received_timestamp=ts,
             read_timestamp=ts,
-            timezone_offset=CURRENT_TZ_OFFSET,
+            timezone_offset=current_tz_offset(),
             message_type=row.get("ZMESSAGETYPE") or 0,
         )
 
@@ -62,3 +62,11 @@ def test_extract_tar_unsafe(tmp_path, member):
     archive = _create_bad_tar(tmp_path, member)
     with pytest.raises(ValueError):
         extract_archive(str(archive))
+
+
+def test_extract_zip_unsafe(tmp_path):
+    archive = tmp_path / "bad.zip"
+    with zipfile.ZipFile(archive, "w") as zf:
+        zf.writestr("../evil.txt", "bad")
+    with pytest.raises(ValueError):
+        extract_archive(str(archive))
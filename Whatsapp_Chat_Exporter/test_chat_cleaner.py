@@ -1,4 +1,9 @@
-from Whatsapp_Chat_Exporter.chat_cleaner import ChatCleaner
+import json
+from datetime import datetime
+
+import pytest
+
+from Whatsapp_Chat_Exporter.chat_cleaner import ChatCleaner, CleaningConfig, MessageData
 from Whatsapp_Chat_Exporter.data_model import ChatCollection, ChatStore, Message
 from Whatsapp_Chat_Exporter.utility import Device
 
@@ -51,3 +56,93 @@ def test_clean_removes_empty_chats():
     ChatCleaner.clean(collection)
 
     assert len(collection) == 0
+
+
+def test_clean_media_references_counts_each_placeholder_kind():
+    cleaner = ChatCleaner(CleaningConfig(clean_broken_media=True))
+    message = MessageData(
+        timestamp=datetime(2024, 1, 1),
+        sender="Ana",
+        content="<Media omitted> <media omitted> [Image not available]",
+    )
+
+    cleaner._clean_media_references([message])
+
+    assert message.content == "[Media] [Media] [Media]"
+    assert cleaner.stats.media_references_cleaned == 2
+
+
+def test_remove_system_messages_with_fused_and_grouped_patterns():
+    messages = [
+        MessageData(timestamp=datetime(2024, 1, 1), sender="Ana", content=text)
+        for text in ("Bob LEFT", "security code changed", "haha", "see you")
+    ]
+
+    fused = ChatCleaner(CleaningConfig())
+    assert len(fused.system_patterns) == 1
+    assert [m.content for m in fused._remove_system_messages(messages)] == [
+        "haha",
+        "see you",
+    ]
+
+    # A backreference keeps the patterns separate so group numbers still apply
+    grouped = ChatCleaner(CleaningConfig(system_message_patterns=[r"(ha)\1", "left"]))
+    assert len(grouped.system_patterns) == 2
+    assert [m.content for m in grouped._remove_system_messages(messages)] == [
+        "security code changed",
+        "see you",
+    ]
+
+
+@pytest.mark.parametrize(
+    "html_parser, expected",
+    [
+        # html.parser nests the unclosed <p> inside the first one
+        ("html.parser", ["00 Ana: one10:01 Bob: two", "01 Bob: two"]),
+        ("lxml", ["00 Ana: one", "01 Bob: two"]),
+    ],
+)
+def test_parse_html_chat_with_unclosed_tags(tmp_path, html_parser, expected):
+    pytest.importorskip("bs4")
+    if html_parser == "lxml":
+        pytest.importorskip("lxml")
+    chat = tmp_path / "chat.html"
+    chat.write_text("<p>10:00 Ana: one<p>10:01 Bob: two", encoding="utf-8")
+
+    cleaner = ChatCleaner(CleaningConfig(html_parser=html_parser))
+    messages = cleaner._parse_html_chat(str(chat))
+
+    assert [m.content for m in messages] == expected
+
+
+def test_clean_directory_with_workers_matches_sequential(tmp_path):
+    input_dir = tmp_path / "chats"
+    input_dir.mkdir()
+    # More files than the 2 * workers parsed ahead, so submission refills
+    for name in "abcdef":
+        (input_dir / f"{name}.txt").write_text(
+            f"[1/2/2024, 10:00] Ana Lopez: hi {name}\n"
+            "[1/2/2024, 10:01] Bob: call +1 (555) 123-4567\n",
+            encoding="utf-8",
+        )
+
+    outputs = []
+    for workers in (1, 2):
+        output_dir = tmp_path / f"out{workers}"
+        config = CleaningConfig(
+            create_backup=False,
+            output_format="json",
+            anonymize_names=True,
+            anonymize_phones=True,
+            workers=workers,
+        )
+        assert ChatCleaner(config).clean_directory(str(input_dir), str(output_dir))
+        outputs.append(
+            {
+                path.name: json.loads(path.read_text(encoding="utf-8"))["messages"]
+                for path in output_dir.iterdir()
+            }
+        )
+
+    assert len(outputs[0]) == 6
+    assert outputs[0] == outputs[1]
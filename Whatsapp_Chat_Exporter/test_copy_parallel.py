@@ -1,4 +1,8 @@
+import errno
 import os
+import sys
+
+import pytest
 
 from Whatsapp_Chat_Exporter.utility import copy_parallel
 
@@ -19,3 +23,72 @@ def test_copy_parallel(tmp_path):
         assert os.path.exists(dst)
         with open(dst) as f:
             assert f.read() in {"0", "1", "2"}
+
+
+def _raise_exdev(*args):
+    raise OSError(errno.EXDEV, "Invalid cross-device link")
+
+
+@pytest.mark.parametrize(
+    "broken", [(), ("copy_file_range",), ("copy_file_range", "sendfile")]
+)
+def test_copy_parallel_fallbacks(tmp_path, monkeypatch, broken):
+    for name in broken:
+        monkeypatch.setattr(os, name, _raise_exdev, raising=False)
+    src = tmp_path / "big.bin"
+    dst = tmp_path / "big_copy.bin"
+    payload = os.urandom(3 * 1024 * 1024 + 17)
+    src.write_bytes(payload)
+    copy_parallel([(str(src), str(dst))], workers=1)
+    assert dst.read_bytes() == payload
+    assert int(os.stat(dst).st_mtime) == int(os.stat(src).st_mtime)
+
+
+def _raise_enotsock(*args):
+    raise OSError(errno.ENOTSOCK, "Socket operation on non-socket")
+
+
+def test_copy_parallel_falls_back_on_any_errno(tmp_path, monkeypatch):
+    monkeypatch.setattr(sys, "platform", "linux")
+    monkeypatch.setattr(os, "copy_file_range", _raise_enotsock, raising=False)
+    monkeypatch.setattr(os, "sendfile", _raise_enotsock, raising=False)
+    src = tmp_path / "a.bin"
+    dst = tmp_path / "b.bin"
+    payload = os.urandom(1024)
+    src.write_bytes(payload)
+    copy_parallel([(str(src), str(dst))], workers=1)
+    assert dst.read_bytes() == payload
+
+
+def test_copy_parallel_non_linux_skips_sendfile(tmp_path, monkeypatch):
+    # macOS has no copy_file_range and its sendfile needs a socket destination
+    monkeypatch.setattr(sys, "platform", "darwin")
+    monkeypatch.delattr(os, "copy_file_range", raising=False)
+    monkeypatch.setattr(os, "sendfile", _raise_enotsock, raising=False)
+    src = tmp_path / "a.bin"
+    dst = tmp_path / "b.bin"
+    payload = os.urandom(1024)
+    src.write_bytes(payload)
+    copy_parallel([(str(src), str(dst))], workers=1)
+    assert dst.read_bytes() == payload
+    assert int(os.stat(dst).st_mtime) == int(os.stat(src).st_mtime)
+
+
+def test_copy_parallel_raises_after_partial_copy(tmp_path, monkeypatch):
+    copy_file_range = getattr(os, "copy_file_range", None)
+    if copy_file_range is None:
+        pytest.skip("os.copy_file_range is not available")
+    calls = []
+
+    def fail_second_call(src_fd, dst_fd, count):
+        calls.append(count)
+        if len(calls) > 1:
+            raise OSError(errno.ENOSPC, "No space left on device")
+        return copy_file_range(src_fd, dst_fd, 10)
+
+    monkeypatch.setattr(sys, "platform", "linux")
+    monkeypatch.setattr(os, "copy_file_range", fail_second_call)
+    src = tmp_path / "a.bin"
+    src.write_bytes(os.urandom(1024))
+    with pytest.raises(OSError):
+        copy_parallel([(str(src), str(tmp_path / "b.bin"))], workers=1)
@@ -44,6 +44,8 @@ class TestSQLInjectionFixes:
         """Test that get_chat_condition handles empty/None filters correctly."""
         result = get_chat_condition(None, True, ["jid", "name"], "jid", "android")
         assert result == ""
+        result = get_chat_condition([], False, ["jid", "name"], "jid", "android")
+        assert result == ""
 
     def test_get_chat_condition_rejects_special_characters(self):
         """Test that get_chat_condition rejects special SQL characters."""
@@ -63,6 +65,104 @@ class TestSQLInjectionFixes:
                     [dangerous_input], True, ["jid", "name"], "jid", "android"
                 )
 
+    def test_get_chat_condition_rejects_invalid_columns(self):
+        """Test that get_chat_condition rejects unsafe column and JID names."""
+        with pytest.raises(ValueError, match="Invalid column name"):
+            get_chat_condition(
+                ["123"], True, ["jid", "name; DROP TABLE"], "jid", "android"
+            )
+        with pytest.raises(ValueError, match="Invalid JID field name"):
+            get_chat_condition(["123"], True, ["jid", "name"], "jid--", "android")
+
+    @pytest.mark.parametrize(
+        "filter, include, columns, jid, platform, expected",
+        [
+            (
+                ["123"],
+                True,
+                ["key_remote_jid"],
+                None,
+                None,
+                "AND (key_remote_jid LIKE '%123%')",
+            ),
+            (
+                ["123"],
+                False,
+                ["key_remote_jid"],
+                None,
+                None,
+                "AND (key_remote_jid NOT LIKE '%123%')",
+            ),
+            (
+                ["123", "456"],
+                True,
+                ["key_remote_jid", "jid_group.raw_string"],
+                "jid_group",
+                "android",
+                (
+                    "AND (key_remote_jid LIKE '%123%'"
+                    " OR (jid_group.raw_string LIKE '%123%' AND jid_group.type == 1)"
+                    " OR key_remote_jid LIKE '%456%'"
+                    " OR (jid_group.raw_string LIKE '%456%' AND jid_group.type == 1))"
+                ),
+            ),
+            (
+                ["123", "456"],
+                False,
+                ["key_remote_jid", "jid_group.raw_string"],
+                "jid_group",
+                "android",
+                (
+                    "AND (key_remote_jid NOT LIKE '%123%'"
+                    " AND (jid_group.raw_string NOT LIKE '%123%'"
+                    " AND jid_group.type == 1)"
+                    " AND key_remote_jid NOT LIKE '%456%'"
+                    " AND (jid_group.raw_string NOT LIKE '%456%'"
+                    " AND jid_group.type == 1))"
+                ),
+            ),
+            (
+                ["123", "456"],
+                True,
+                ["ZCONTACTJID", "ZMEMBERJID"],
+                "ZGROUPINFO",
+                "ios",
+                (
+                    "AND (ZCONTACTJID LIKE '%123%'"
+                    " OR (ZMEMBERJID LIKE '%123%' AND ZGROUPINFO IS NOT NULL)"
+                    " OR ZCONTACTJID LIKE '%456%'"
+                    " OR (ZMEMBERJID LIKE '%456%' AND ZGROUPINFO IS NOT NULL))"
+                ),
+            ),
+            (
+                ["123", "456"],
+                False,
+                ["ZCONTACTJID", "ZMEMBERJID"],
+                "ZGROUPINFO",
+                "ios",
+                (
+                    "AND (ZCONTACTJID NOT LIKE '%123%'"
+                    " AND (ZMEMBERJID NOT LIKE '%123%' AND ZGROUPINFO IS NOT NULL)"
+                    " AND ZCONTACTJID NOT LIKE '%456%'"
+                    " AND (ZMEMBERJID NOT LIKE '%456%' AND ZGROUPINFO IS NOT NULL))"
+                ),
+            ),
+            (
+                ["123", "456", "123"],
+                True,
+                ["key_remote_jid"],
+                None,
+                None,
+                "AND (key_remote_jid LIKE '%123%' OR key_remote_jid LIKE '%456%')",
+            ),
+        ],
+    )
+    def test_get_chat_condition_exact_sql(
+        self, filter, include, columns, jid, platform, expected
+    ):
+        """Test the exact SQL generated for include/exclude filters."""
+        assert get_chat_condition(filter, include, columns, jid, platform) == expected
+
 
 class TestPathTraversalFixes:
     """Test path traversal prevention."""
@@ -105,8 +105,7 @@ class TestSecureFileOperations:
             assert file_stat.st_mode & 0o777 == 0o600
         finally:
             temp_file.close()
-            if os.path.exists(temp_file.name):
-                os.unlink(temp_file.name)
+            Path(temp_file.name).unlink(missing_ok=True)
 
     def test_secure_temp_dir(self):
         """Test secure temporary directory creation."""
@@ -130,5 +129,4 @@ class TestSecureFileOperations:
             assert Path(temp_file.name).parent == tmp_path
         finally:
             temp_file.close()
-            if os.path.exists(temp_file.name):
-                os.unlink(temp_file.name)
+            Path(temp_file.name).unlink(missing_ok=True)
@@ -1,4 +1,15 @@
-from Whatsapp_Chat_Exporter.utility import determine_metadata
+import json
+
+import pytest
+
+from Whatsapp_Chat_Exporter import utility
+from Whatsapp_Chat_Exporter.utility import (
+    bytes_to_readable,
+    convert_time_unit,
+    determine_metadata,
+    import_from_json,
+    sanitize_filename,
+)
 
 
 def test_added_participant():
@@ -33,3 +44,108 @@ def test_joined_via_link():
 def test_added_fallback():
     content = {"action_type": 12, "is_me_joined": 0, "data": None}
     assert determine_metadata(content, "Alice") == "Alice added someone"
+
+
+def test_static_and_ignored_actions():
+    content = {"action_type": 5, "is_me_joined": 0, "data": None}
+    assert determine_metadata(content, "Alice") == "Alice left the group"
+    content = {"action_type": 19, "is_me_joined": 0, "data": None}
+    assert determine_metadata(content, "Alice") == (
+        "This chat is now end-to-end encrypted"
+    )
+    content = {"action_type": 13, "is_me_joined": 0, "data": None}
+    assert determine_metadata(content, "Alice") is None
+
+
+def test_changed_number():
+    content = {
+        "action_type": 10,
+        "is_me_joined": 0,
+        "old_jid": "111@s.whatsapp.net",
+        "new_jid": "222@s.whatsapp.net",
+    }
+    assert determine_metadata(content, "Alice") == "111 changed their number to 222"
+
+
+@pytest.mark.parametrize(
+    "seconds, expected",
+    [
+        (0, "less than a second"),
+        (1, "a second"),
+        (5, "5 seconds"),
+        (42, "42 seconds"),
+        (60, "a minute"),
+        (90, "01:30 minutes"),
+        (3600, "an hour"),
+        (3725, "1:02:05 hour"),
+        (86400, "1 day, 0:00:00"),
+        (2 * 86400 + 61, "2 days, 0:01:01"),
+    ],
+)
+def test_convert_time_unit(seconds, expected):
+    assert convert_time_unit(seconds) == expected
+
+
+def test_import_from_json_interns_repeated_strings(tmp_path):
+    def msg(key_id):
+        return {
+            "from_me": False,
+            "timestamp": 1700000000,
+            "time": "12:00",
+            "key_id": key_id,
+            "sender": "".join(["Ali", "ce"]),
+            "mime": "".join(["image/", "jpeg"]),
+        }
+
+    path = tmp_path / "result.json"
+    path.write_text(
+        json.dumps(
+            {
+                "123@s.whatsapp.net": {
+                    "type": "android",
+                    "name": "Alice",
+                    "messages": {"1": msg(1), "2": msg(2)},
+                }
+            }
+        )
+    )
+    data = {}
+    import_from_json(str(path), data)
+    chat = data["123@s.whatsapp.net"]
+    first, second = chat.get_message("1"), chat.get_message("2")
+    assert first.mime == "image/jpeg"
+    assert first.mime is second.mime
+    assert first.sender is second.sender
+
+
+@pytest.mark.parametrize(
+    "name, expected",
+    [
+        ("Alice - Bob", "Alice - Bob"),
+        ("../etc/passwd", "etcpasswd"),
+        ("Ünïcödé_!@#", "Ünïcödé"),
+        ("名字 测试", "名字 测试"),
+    ],
+)
+def test_sanitize_filename(name, expected):
+    assert sanitize_filename(name) == expected
+
+
+@pytest.mark.parametrize(
+    "size, expected",
+    [
+        (0, "0B"),
+        (1, "1.0 B"),
+        (1023, "1023.0 B"),
+        (1024, "1.0 KB"),
+        (1536, "1.5 KB"),
+        (5 * 1024**3, "5.0 GB"),
+        (1024**9, "1024.0 YB"),
+    ],
+)
+def test_bytes_to_readable(size, expected):
+    assert bytes_to_readable(size) == expected
+
+
+def test_current_tz_offset_alias():
+    assert utility.CURRENT_TZ_OFFSET == utility.current_tz_offset()
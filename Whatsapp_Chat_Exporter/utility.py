@@ -1,6 +1,5 @@
 import json
 import logging
-import math
 import os
 import re
 import shutil
@@ -13,6 +12,7 @@ import zipfile
 from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime, timedelta
 from enum import IntEnum
+from functools import lru_cache
 from typing import Dict, List, Optional, Tuple
 
 import jinja2
@@ -39,7 +39,22 @@ except ImportError:
 
 MAX_SIZE = 4 * 1024 * 1024  # Default 4MB
 ROW_SIZE = 0x3D0
-CURRENT_TZ_OFFSET = datetime.now().astimezone().utcoffset().total_seconds() / 3600
+UPDATE_CHECK_TIMEOUT = 3  # seconds
+SIZE_NAMES = ("B", "KB", "MB", "GB", "TB", "PB", "EB", "ZB", "YB")
+
+
+@lru_cache(maxsize=1)
+def current_tz_offset() -> float:
+    """Return the local UTC offset in hours, computed on first use."""
+    return datetime.now().astimezone().utcoffset().total_seconds() / 3600
+
+
+def __getattr__(name: str):
+    # CURRENT_TZ_OFFSET used to be a constant computed at import time; keep
+    # the name importable while still deferring the lookup to first use
+    if name == "CURRENT_TZ_OFFSET":
+        return current_tz_offset()
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
 
 
 def convert_time_unit(time_second: int) -> str:
@@ -51,23 +66,23 @@ def convert_time_unit(time_second: int) -> str:
     Returns:
         str: A human-readable string representing the time duration.
     """
-    time = str(timedelta(seconds=time_second))
-    if "day" not in time:
-        if time_second < 1:
-            time = "less than a second"
-        elif time_second == 1:
-            time = "a second"
-        elif time_second < 60:
-            time = time[5:][1 if time_second < 10 else 0 :] + " seconds"
-        elif time_second == 60:
-            time = "a minute"
-        elif time_second < 3600:
-            time = time[2:] + " minutes"
-        elif time_second == 3600:
-            time = "an hour"
-        else:
-            time += " hour"
-    return time
+    if time_second < 0 or time_second >= 86400:
+        return str(timedelta(seconds=time_second))
+    if time_second < 1:
+        return "less than a second"
+    if time_second == 1:
+        return "a second"
+    if time_second < 60:
+        return f"{time_second} seconds"
+    if time_second == 60:
+        return "a minute"
+    minutes, seconds = divmod(time_second, 60)
+    if time_second < 3600:
+        return f"{minutes:02d}:{seconds:02d} minutes"
+    if time_second == 3600:
+        return "an hour"
+    hours, minutes = divmod(minutes, 60)
+    return f"{hours}:{minutes:02d}:{seconds:02d} hour"
 
 
 def bytes_to_readable(size_bytes: int) -> str:
@@ -86,11 +101,10 @@ def bytes_to_readable(size_bytes: int) -> str:
     """
     if size_bytes == 0:
         return "0B"
-    size_name = ("B", "KB", "MB", "GB", "TB", "PB", "EB", "ZB", "YB")
-    i = int(math.floor(math.log(size_bytes, 1024)))
-    p = math.pow(1024, i)
-    s = round(size_bytes / p, 2)
-    return "%s %s" % (s, size_name[i])
+    # 1024 == 2**10, so the unit index is the bit length divided by ten
+    i = min((int(size_bytes).bit_length() - 1) // 10, len(SIZE_NAMES) - 1)
+    s = round(size_bytes / (1 << (10 * i)), 2)
+    return "%s %s" % (s, SIZE_NAMES[i])
 
 
 def readable_to_bytes(size_str: str) -> int:
@@ -135,34 +149,37 @@ def extract_archive(path: str) -> str:
     Raises:
         ValueError: If the file format is not supported.
     """
-    tmp_dir = tempfile.mkdtemp(prefix="wce_")
-
-    if zipfile.is_zipfile(path):
-        with zipfile.ZipFile(path) as zf:
-            # Validate ZIP file paths to prevent path traversal
-            for member in zf.namelist():
-                # Normalize the path and check for traversal attempts
-                target = os.path.normpath(os.path.join(tmp_dir, member))
-                if not target.startswith(os.path.abspath(tmp_dir) + os.sep):
-                    shutil.rmtree(tmp_dir)
-                    raise ValueError(f"Unsafe path detected in archive: {member}")
-            zf.extractall(tmp_dir)
-    else:
-        try:
-            with tarfile.open(path) as tf:
-                members = []
-                for member in tf.getmembers():
-                    target = os.path.normpath(os.path.join(tmp_dir, member.name))
-                    if not target.startswith(os.path.abspath(tmp_dir) + os.sep):
-                        shutil.rmtree(tmp_dir)
-                        raise ValueError(
-                            f"Unsafe path detected in archive: {member.name}"
-                        )
-                    members.append(member)
-                tf.extractall(tmp_dir, members=members)
-        except tarfile.TarError as exc:
-            shutil.rmtree(tmp_dir)
-            raise ValueError("Unsupported archive format") from exc
+    tmp_dir = os.path.abspath(tempfile.mkdtemp(prefix="wce_"))
+    tmp_prefix = tmp_dir + os.sep
+
+    def is_safe(name: str) -> bool:
+        # Normalize the path and check for traversal attempts
+        target = os.path.normpath(os.path.join(tmp_dir, name))
+        return target.startswith(tmp_prefix)
+
+    def safe_members(tf: tarfile.TarFile):
+        for member in tf:
+            if not is_safe(member.name):
+                raise ValueError(f"Unsafe path detected in archive: {member.name}")
+            yield member
+
+    try:
+        if zipfile.is_zipfile(path):
+            with zipfile.ZipFile(path) as zf:
+                # Validate ZIP file paths to prevent path traversal
+                for member in zf.namelist():
+                    if not is_safe(member):
+                        raise ValueError(f"Unsafe path detected in archive: {member}")
+                zf.extractall(tmp_dir)
+        else:
+            try:
+                with tarfile.open(path) as tf:
+                    tf.extractall(tmp_dir, members=safe_members(tf))
+            except tarfile.TarError as exc:
+                raise ValueError("Unsupported archive format") from exc
+    except Exception:
+        shutil.rmtree(tmp_dir, ignore_errors=True)
+        raise
 
     return tmp_dir
 
@@ -211,7 +228,7 @@ def check_update(allow_network: bool = False):
 
     PACKAGE_JSON = "https://pypi.org/pypi/whatsapp-chat-exporter/json"
     try:
-        raw = urllib.request.urlopen(PACKAGE_JSON)
+        raw = urllib.request.urlopen(PACKAGE_JSON, timeout=UPDATE_CHECK_TIMEOUT)
     except Exception:
         logger.warning("Failed to check for updates.")
         return 1
@@ -285,9 +302,17 @@ class Device(StrEnum):
     EXPORTED = "exported"
 
 
+def _intern(value):
+    """Intern ``value`` if it is a string, otherwise return it unchanged."""
+    return sys.intern(value) if isinstance(value, str) else value
+
+
 def import_from_json(json_file: str, data: Dict[str, ChatStore]):
     """Imports chat data from a JSON file into the data dictionary.
 
+    Low-cardinality string fields (chat type, sender, MIME type, time of day)
+    are interned so that duplicates across messages share a single object.
+
     Args:
         json_file: The path to the JSON file.
         data: The dictionary to store the imported chat data.
@@ -304,7 +329,7 @@ def import_from_json(json_file: str, data: Dict[str, ChatStore]):
         transient=True,
         disable=not sys.stdout.isatty(),
     ):
-        chat = ChatStore(chat_data.get("type"), chat_data.get("name"))
+        chat = ChatStore(_intern(chat_data.get("type")), chat_data.get("name"))
         chat.my_avatar = chat_data.get("my_avatar")
         chat.their_avatar = chat_data.get("their_avatar")
         chat.their_avatar_thumb = chat_data.get("their_avatar_thumb")
@@ -313,7 +338,7 @@ def import_from_json(json_file: str, data: Dict[str, ChatStore]):
             message = Message(
                 from_me=msg["from_me"],
                 timestamp=msg["timestamp"],
-                time=msg["time"],
+                time=_intern(msg["time"]),
                 key_id=msg["key_id"],
                 received_timestamp=msg.get("received_timestamp"),
                 read_timestamp=msg.get("read_timestamp"),
@@ -321,16 +346,33 @@ def import_from_json(json_file: str, data: Dict[str, ChatStore]):
             message.media = msg.get("media")
             message.meta = msg.get("meta")
             message.data = msg.get("data")
-            message.sender = msg.get("sender")
+            message.sender = _intern(msg.get("sender"))
             message.safe = msg.get("safe")
-            message.mime = msg.get("mime")
+            message.mime = _intern(msg.get("mime"))
             message.reply = msg.get("reply")
             message.quoted_data = msg.get("quoted_data")
             message.caption = msg.get("caption")
             message.thumb = msg.get("thumb")
             message.sticker = msg.get("sticker")
             chat.add_message(id, message)
-        data[jid] = chat
+        data[sys.intern(jid)] = chat
+
+
+class _FilenameTable(dict):
+    """``str.translate`` table that keeps alphanumerics, ``-`` and spaces.
+
+    Entries are filled in on first lookup so that any Unicode code point is
+    classified once with :meth:`str.isalnum` and then served from the dict.
+    """
+
+    def __missing__(self, codepoint: int) -> Optional[int]:
+        char = chr(codepoint)
+        value = codepoint if char.isalnum() or char in "- " else None
+        self[codepoint] = value
+        return value
+
+
+_FILENAME_TABLE = _FilenameTable()
 
 
 def sanitize_filename(file_name: str) -> str:
@@ -342,7 +384,7 @@ def sanitize_filename(file_name: str) -> str:
     Returns:
         The sanitized filename.
     """
-    return "".join(x for x in file_name if x.isalnum() or x in "- ")
+    return file_name.translate(_FILENAME_TABLE)
 
 
 def is_group_jid(jid: str) -> bool:
@@ -395,6 +437,20 @@ def get_file_name(contact: str, chat: ChatStore) -> Tuple[str, str]:
     return sanitize_filename(file_name), name
 
 
+def _is_sql_identifier(name: str) -> bool:
+    """Return True if ``name`` is safe to interpolate as a column reference.
+
+    Accepts an ASCII identifier optionally qualified with its table
+    ("jid.raw_string"). str.isidentifier runs in C, so this avoids the
+    regex engine on every SQL assembly.
+    """
+    if not name.isascii():
+        return False
+    table, dot, column = name.partition(".")
+    return table.isidentifier() and (not dot or column.isidentifier())
+
+
+@lru_cache(maxsize=32)
 def get_cond_for_empty(enable: bool, jid_field: str, broadcast_field: str) -> str:
     """Generates a SQL condition for filtering empty chats.
 
@@ -408,16 +464,10 @@ def get_cond_for_empty(enable: bool, jid_field: str, broadcast_field: str) -> st
     """
     if enable:
         # Validate field names to prevent SQL injection
-        import re
-
-        if not re.match(
-            r"^[a-zA-Z_][a-zA-Z0-9_]*(\.[a-zA-Z_][a-zA-Z0-9_]*)?$", jid_field
-        ):
+        if not _is_sql_identifier(jid_field):
             raise ValueError(f"Invalid JID field name: {jid_field}")
 
-        if not re.match(
-            r"^[a-zA-Z_][a-zA-Z0-9_]*(\.[a-zA-Z_][a-zA-Z0-9_]*)?$", broadcast_field
-        ):
+        if not _is_sql_identifier(broadcast_field):
             raise ValueError(f"Invalid broadcast field name: {broadcast_field}")
 
         return f"AND (chat.hidden=0 OR {jid_field}='status@broadcast' OR {broadcast_field}>0)"
@@ -425,6 +475,44 @@ def get_cond_for_empty(enable: bool, jid_field: str, broadcast_field: str) -> st
         return ""
 
 
+# How each platform's schema marks a chat as a group, keyed by platform
+_IS_GROUP_TEMPLATES = {
+    "android": "{jid}.type == 1",
+    "ios": "{jid} IS NOT NULL",
+}
+
+
+@lru_cache(maxsize=128)
+def _group_condition(
+    columns: Tuple[str, ...], jid: Optional[str], platform: Optional[str]
+) -> Optional[str]:
+    """Validate the arguments of get_chat_condition that name SQL objects.
+
+    The handlers call get_chat_condition with the same handful of column
+    sets for every export, so the result is cached per combination.
+
+    Returns:
+        Optional[str]: The group predicate for jid, or None if jid is None.
+    """
+    if len(columns) < 2 and jid is not None:
+        raise ValueError(
+            "There must be at least two elements in argument columns if jid is not None"
+        )
+    for column in columns:
+        if not _is_sql_identifier(column):
+            raise ValueError(f"Invalid column name: {column}")
+    if jid is None:
+        return None
+    if not _is_sql_identifier(jid):
+        raise ValueError(f"Invalid JID field name: {jid}")
+    template = _IS_GROUP_TEMPLATES.get(platform)
+    if template is None:
+        raise ValueError(
+            "Only android and ios are supported for argument platform if jid is not None"
+        )
+    return template.format(jid=jid)
+
+
 def get_chat_condition(
     filter: Optional[List[str]],
     include: bool,
@@ -442,48 +530,28 @@ def get_chat_condition(
         platform: The platform ("android" or "ios") for platform-specific JID queries.
 
     Returns:
-        str: SQL condition string.
+        str: SQL condition string, or an empty string if filter is None or empty.
 
     Raises:
         ValueError: If the column count is invalid or an unsupported platform is provided.
     """
-    if filter is not None:
-        conditions = []
-        if len(columns) < 2 and jid is not None:
-            raise ValueError(
-                "There must be at least two elements in argument columns if jid is not None"
-            )
-        if jid is not None:
-            if platform == "android":
-                is_group = f"{jid}.type == 1"
-            elif platform == "ios":
-                is_group = f"{jid} IS NOT NULL"
-            else:
-                raise ValueError(
-                    "Only android and ios are supported for argument platform if jid is not None"
-                )
-        for index, chat in enumerate(filter):
-            # Security: Validate input to prevent SQL injection
-            if not chat.isnumeric():
-                raise ValueError("Chat filter must contain digits only")
-
-            if include:
-                conditions.append(
-                    f"{' OR' if index > 0 else ''} {columns[0]} LIKE '%{chat}%'"
-                )
-                if len(columns) > 1:
-                    conditions.append(
-                        f" OR ({columns[1]} LIKE '%{chat}%' AND {is_group})"
-                    )
-            else:
-                conditions.append(
-                    f"{' AND' if index > 0 else ''} {columns[0]} NOT LIKE '%{chat}%'"
-                )
-                if len(columns) > 1:
-                    conditions.append(
-                        f" AND ({columns[1]} NOT LIKE '%{chat}%' AND {is_group})"
-                    )
-        return f"AND ({' '.join(conditions)})"
+    # An empty list would otherwise produce the invalid fragment "AND ()"
+    if filter:
+        # Security: Validate input to prevent SQL injection. The whole filter
+        # is checked up front so the assembly loop below never has to raise.
+        if not all(map(str.isnumeric, filter)):
+            raise ValueError("Chat filter must contain digits only")
+        is_group = _group_condition(tuple(columns), jid, platform)
+        op, separator = ("LIKE", "OR") if include else ("NOT LIKE", "AND")
+        # One template per chat: the '%chat%' pattern is formatted once per
+        # chat even when it is matched against both columns
+        template = f"{columns[0]} {op} '%{{0}}%'"
+        if len(columns) > 1:
+            template += f" {separator} ({columns[1]} {op} '%{{0}}%' AND {is_group})"
+        connector = f" {separator} "
+        # A repeated chat would only add an identical term to the OR/AND chain
+        chats = dict.fromkeys(filter)
+        return f"AND ({connector.join([template.format(chat) for chat in chats])})"
     else:
         return ""
 
@@ -510,14 +578,18 @@ class DbType(StrEnum):
     CONTACT = "contact"
 
 
+_PARTICIPANT_TOKEN_PATTERN = re.compile(r'[^"\n ,;]+')
+
+
 def _extract_participant(data: Optional[str]) -> Optional[str]:
     """Return participant identifier from metadata."""
 
     if not data:
         return None
-    cleaned = re.sub(r'["\n]', " ", str(data))
-    for token in re.split(r"[ ,;]+", cleaned):
-        token = token.strip()
+    # Tokens are the runs between quotes, newlines, spaces, commas and
+    # semicolons; scanning lazily stops at the first usable one
+    for match in _PARTICIPANT_TOKEN_PATTERN.finditer(str(data)):
+        token = match.group().strip()
         if not token:
             continue
         if "@" in token:
@@ -526,6 +598,82 @@ def _extract_participant(data: Optional[str]) -> Optional[str]:
     return None
 
 
+def _changed_group_name(content, msg: str) -> str:
+    return msg + f" changed the group name to \"{content['data']}\""
+
+
+def _added_to_group(content, msg: str) -> str:
+    return f"{_extract_participant(content['data']) or msg} was added to the group"
+
+
+def _changed_number(content, msg: str) -> Optional[str]:
+    try:
+        old = content["old_jid"].split("@")[0]
+        new = content["new_jid"].split("@")[0]
+    except (AttributeError, IndexError):
+        return None
+    return f"{old} changed their number to {new}"
+
+
+def _created_group(content, msg: str) -> str:
+    return msg + f' created a group with name: "{content["data"]}"'
+
+
+def _added_participant(content, msg: str) -> str:
+    return msg + f" added {_extract_participant(content['data']) or 'someone'}"
+
+
+def _removed_participant(content, msg: str) -> str:
+    return msg + f" removed {_extract_participant(content['data']) or 'someone'}"
+
+
+def _security_code_changed(content, msg: str) -> str:
+    if msg != "You":
+        return f"The security code between you and {msg} changed"
+    return "The security code in this chat changed"
+
+
+def _joined_by_link(content, msg: str) -> str:
+    return (
+        f"{_extract_participant(content['data']) or msg or 'Someone'} joined this "
+        "group by using an invite link"
+    )
+
+
+def _changed_group_description(content, msg: str) -> str:
+    details = (content["data"] or "Unknown").replace("\n", "<br>")
+    return msg + " changed the group description to:<br>" + details
+
+
+# Dispatch table for group/system messages keyed by ``action_type``. Values are
+# either a callable ``(content, msg)`` or a precomputed string; strings that
+# start with a space are suffixed to the actor's name. Actions 13, 15, 46, 67
+# and 69 are deliberately absent so that they yield ``None``.
+_METADATA_ACTIONS = {
+    1: _changed_group_name,
+    4: _added_to_group,
+    5: " left the group",
+    6: " changed the group icon",
+    7: "You were removed",
+    8: "WhatsApp Internal Error Occurred: you cannot send message to this group",
+    9: " created a broadcast channel",
+    10: _changed_number,
+    11: _created_group,
+    12: _added_participant,
+    14: _removed_participant,
+    18: _security_code_changed,
+    19: "This chat is now end-to-end encrypted",
+    20: _joined_by_link,
+    27: _changed_group_description,
+    28: _changed_number,
+    47: "The contact is an official business account",
+    50: "The contact's account type changed from business to standard",
+    56: "Messgae timer was enabled/updated/disabled",
+    57: _security_code_changed,
+    58: "You blocked this contact",
+}
+
+
 def determine_metadata(content: sqlite3.Row, init_msg: Optional[str]) -> Optional[str]:
     """Return a user friendly description for a group/system message."""
 
@@ -533,60 +681,12 @@ def determine_metadata(content: sqlite3.Row, init_msg: Optional[str]) -> Optiona
     if content["is_me_joined"] == 1:
         return f"You were added into the group by {msg}"
 
-    action = content["action_type"]
-
-    if action == 1:
-        return msg + f" changed the group name to \"{content['data']}\""
-    if action in (10, 28):
-        try:
-            old = content["old_jid"].split("@")[0]
-            new = content["new_jid"].split("@")[0]
-        except (AttributeError, IndexError):
-            return None
-        return f"{old} changed their number to {new}"
-    if action == 27:
-        details = (content["data"] or "Unknown").replace("\n", "<br>")
-        return msg + " changed the group description to:<br>" + details
-    if action in (18, 57):
-        return (
-            f"The security code between you and {msg} changed"
-            if msg != "You"
-            else "The security code in this chat changed"
-        )
-    if action in (13, 15, 46, 67, 69):
-        return None
-
-    static_actions = {
-        4: lambda c, m: (
-            f"{_extract_participant(c['data']) or m} was added to the group"
-        ),
-        5: " left the group",
-        6: " changed the group icon",
-        7: "You were removed",
-        8: (
-            "WhatsApp Internal Error Occurred: " "you cannot send message to this group"
-        ),
-        9: " created a broadcast channel",
-        11: lambda c, m: m + f' created a group with name: "{c["data"]}"',
-        12: lambda c, m: m + f" added {_extract_participant(c['data']) or 'someone'}",
-        14: lambda c, m: m + f" removed {_extract_participant(c['data']) or 'someone'}",
-        19: "This chat is now end-to-end encrypted",
-        20: lambda c, m: (
-            f"{_extract_participant(c['data']) or m or 'Someone'} joined this "
-            "group by using an invite link"
-        ),
-        47: "The contact is an official business account",
-        50: "The contact's account type changed from business to standard",
-        56: "Messgae timer was enabled/updated/disabled",
-        58: "You blocked this contact",
-    }
-
-    handler = static_actions.get(action)
+    handler = _METADATA_ACTIONS.get(content["action_type"])
     if handler is None:
         return None
-    if callable(handler):
-        return handler(content, msg)
-    return msg + handler if handler.startswith(" ") else handler
+    if isinstance(handler, str):
+        return msg + handler if handler[0] == " " else handler
+    return handler(content, msg)
 
 
 def get_status_location(
@@ -663,6 +763,10 @@ def setup_template(
 APPLE_TIME = 978307200
 
 
+_SLUG_STRIP_PATTERN = re.compile(r"[^\w\s-]")
+_SLUG_DASH_PATTERN = re.compile(r"[-\s]+")
+
+
 def slugify(value: str, allow_unicode: bool = False) -> str:
     """
     Convert text to ASCII-only slugs for URL-safe strings.
@@ -684,8 +788,61 @@ def slugify(value: str, allow_unicode: bool = False) -> str:
             .encode("ascii", "ignore")
             .decode("ascii")
         )
-    value = re.sub(r"[^\w\s-]", "", value.lower())
-    return re.sub(r"[-\s]+", "-", value).strip("-_")
+    value = _SLUG_STRIP_PATTERN.sub("", value.lower())
+    return _SLUG_DASH_PATTERN.sub("-", value).strip("-_")
+
+
+COPY_BUFFER_SIZE = 1 << 20  # 1 MiB
+
+
+def _kernel_copy(copy_func, src_fd: int, dst_fd: int, size: int) -> bool:
+    """Run ``copy_func`` until EOF using the current file offsets.
+
+    Returns False when the primitive fails before copying anything, so the
+    caller can try the next strategy. Errors after a partial copy are raised.
+    """
+    remaining = max(size, COPY_BUFFER_SIZE)
+    copied = 0
+    try:
+        while sent := copy_func(src_fd, dst_fd, remaining):
+            copied += sent
+    except OSError:
+        if copied == 0:
+            return False
+        raise
+    return True
+
+
+def _copy_file_range(src_fd: int, dst_fd: int, count: int) -> int:
+    return os.copy_file_range(src_fd, dst_fd, count)
+
+
+def _sendfile(src_fd: int, dst_fd: int, count: int) -> int:
+    return os.sendfile(dst_fd, src_fd, None, count)
+
+
+def _smart_copy(src: str, dst: str) -> None:
+    """Copy ``src`` to ``dst`` including metadata.
+
+    On Linux, data is copied in-kernel with ``os.copy_file_range`` where
+    available, then ``os.sendfile``, and finally :func:`shutil.copyfileobj`
+    with a 1 MiB buffer. Other platforms use :func:`shutil.copy2`, which
+    already has its own fast paths (``fcopyfile`` on macOS) and where
+    ``os.sendfile`` only accepts a socket as destination.
+    """
+    if not sys.platform.startswith("linux"):
+        shutil.copy2(src, dst)
+        return
+    with open(src, "rb", buffering=0) as fsrc, open(dst, "wb", buffering=0) as fdst:
+        src_fd, dst_fd = fsrc.fileno(), fdst.fileno()
+        size = os.fstat(src_fd).st_size
+        copied = (
+            hasattr(os, "copy_file_range")
+            and _kernel_copy(_copy_file_range, src_fd, dst_fd, size)
+        ) or (hasattr(os, "sendfile") and _kernel_copy(_sendfile, src_fd, dst_fd, size))
+        if not copied:
+            shutil.copyfileobj(fsrc, fdst, length=COPY_BUFFER_SIZE)
+    shutil.copystat(src, dst)
 
 
 def copy_parallel(file_pairs: List[Tuple[str, str]], workers: int = 4) -> None:
@@ -696,7 +853,7 @@ def copy_parallel(file_pairs: List[Tuple[str, str]], workers: int = 4) -> None:
         workers: Maximum number of concurrent threads.
     """
     with ThreadPoolExecutor(max_workers=workers) as executor:
-        tasks = [executor.submit(shutil.copy2, src, dst) for src, dst in file_pairs]
+        tasks = [executor.submit(_smart_copy, src, dst) for src, dst in file_pairs]
         for task in tasks:
             task.result()
 
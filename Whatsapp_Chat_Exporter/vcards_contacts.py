@@ -1,7 +1,16 @@
+import re
+from functools import lru_cache
 from typing import List, TypedDict
 
 import vobject
 
+# Everything except digits and "+" is formatting noise in a phone number
+_NON_PHONE_CHARS = re.compile(r"[^\d+]")
+# bytes.translate deletion table with the same meaning for ASCII input
+_NON_PHONE_BYTES = bytes(
+    c for c in range(128) if not chr(c).isdigit() and chr(c) != "+"
+)
+
 
 class ExportedContactNumbers(TypedDict):
     full_name: str
@@ -60,32 +69,45 @@ def filter_chats_by_prefix(chats, prefix: str):
 def map_number_to_name(contacts, default_country_code: str):
     mapping = []
     for contact in contacts:
-        for index, num in enumerate(contact["numbers"]):
+        numbers = contact["numbers"]
+        multiple = len(numbers) > 1
+        for index, num in enumerate(numbers, 1):
             normalized = normalize_number(num, default_country_code)
-            if len(contact["numbers"]) > 1:
-                name = f"{contact['full_name']} ({index+1})"
+            if multiple:
+                name = f"{contact['full_name']} ({index})"
             else:
                 name = contact["full_name"]
             mapping.append((normalized, name))
     return mapping
 
 
+@lru_cache(maxsize=8192)
 def normalize_number(number: str, country_code: str) -> str:
     """Normalise ``number`` by removing formatting characters and applying the
-    provided ``country_code`` if required."""
+    provided ``country_code`` if required.
 
-    # Clean the number
-    number = "".join(c for c in number if c.isdigit() or c == "+")
+    Results are memoised since the same number often appears on several
+    contacts (shared lines, duplicate entries)."""
 
-    if number.startswith("+"):
-        return number[1:]
+    return _apply_country_code(_clean_number(number), country_code)
 
-    if number.startswith("00"):
-        return number[2:]
 
-    if number.startswith("0"):
-        number = number[1:]
-        if not country_code:
-            return number
+def _clean_number(number: str) -> str:
+    """Drop every character except digits and ``+`` from ``number``."""
+    # Numbers stored as bare digits need no cleaning; isdecimal() runs in C
+    if number.isdecimal():
+        return number
+    if number.isascii():
+        return number.encode("ascii").translate(None, _NON_PHONE_BYTES).decode("ascii")
+    return _NON_PHONE_CHARS.sub("", number)
 
+
+def _apply_country_code(number: str, country_code: str) -> str:
+    """Strip international prefixes from an already cleaned ``number``."""
+    if number[:1] == "+":
+        return number[1:]
+    if number[:2] == "00":
+        return number[2:]
+    if number[:1] == "0":
+        return number[1:] if not country_code else country_code + number[1:]
     return country_code + number
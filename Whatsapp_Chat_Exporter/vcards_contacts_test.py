@@ -52,3 +52,11 @@ def test_normalize_number():
     assert normalize_number("0531-234-567", "58") == "58531234567"
     assert normalize_number("0531234567", "") == "531234567"
     assert normalize_number("0531-234-567", "") == "531234567"
+
+
+def test_read_vcards_file_rereads_updated_file(tmp_path):
+    path = tmp_path / "contacts.vcf"
+    path.write_text("BEGIN:VCARD\nFN:John Doe\nTEL:+1234567890\nEND:VCARD\n")
+    assert read_vcards_file(str(path), "1") == [("1234567890", "John Doe")]
+    path.write_text("BEGIN:VCARD\nFN:Jane Roe\nTEL:+19876543210\nEND:VCARD\n")
+    assert read_vcards_file(str(path), "1") == [("19876543210", "Jane Roe")]
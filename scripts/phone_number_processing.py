@@ -1,22 +1,94 @@
 """
 Utility functions to normalize and format telephone numbers found in VCARD
 files. Uses the :mod:`phonenumbers` package to work with phone numbers from any
-country. Primarily designed for Mexican (MX) and US phone numbers, with support
-for international numbers including Brazilian legacy compatibility.
+country; only parsing, formatting and validation are needed, so the
+``phonenumberslite`` distribution (no geocoder/carrier/timezone data)
+suffices. Primarily designed for Mexican (MX) and US phone numbers, with
+support for international numbers including Brazilian legacy compatibility.
 
 Originally contributed by @magpires, adapted for MX/US focus
 """
 
 import argparse
+import functools
+import itertools
+import os
 import re
-from typing import Optional, Tuple
+import shutil
+import tempfile
+from concurrent.futures import ProcessPoolExecutor
+from typing import Dict, Iterator, List, Optional, TextIO, Tuple
 
 import phonenumbers  # type: ignore
 from phonenumbers import PhoneNumber, PhoneNumberFormat
 
+# Regex to capture any telephone line.
+# It matches lines starting with "TEL:" or "TEL;TYPE=..." or with prefixes like "item1.TEL:".
+# vCard property names are ASCII (RFC 6350).
+_PHONE_PATTERN = re.compile(
+    r"^(?P<prefix>.*TEL(?:;TYPE=[^:]+)?):(?P<number>.*)$", re.ASCII
+)
+
+# "+" followed only by ASCII digits and common separators, i.e. no extension,
+# letters or non-Latin digits; anything else takes the full parse
+_E164_CANDIDATE = re.compile(r"\+[\d\s().-]{7,}", re.ASCII)
+_NON_DIGITS = re.compile(r"\D", re.ASCII)
+# Property name written for normalized numbers that carry no TYPE parameter
+_TEL_CELL_PREFIX = "TEL;TYPE=CELL"
+# Per-line writes are coalesced into 1 MiB chunks before reaching the OS
+_IO_BUFFER_SIZE = 1 << 20
+
+
+def _build_country_code_prefixes() -> Dict[str, Tuple[int, int]]:
+    """Map every 3-digit string to ``(country_code, length)``.
+
+    No country calling code is a prefix of another, so the first three digits
+    of an international number identify its country code unambiguously.
+    """
+    prefixes = {}
+    for country_code in phonenumbers.COUNTRY_CODE_TO_REGION_CODE:
+        code = str(country_code)
+        padding = 3 - len(code)
+        for suffix in range(10**padding):
+            key = code + (str(suffix).zfill(padding) if padding else "")
+            prefixes[key] = (country_code, len(code))
+    return prefixes
+
+
+_COUNTRY_CODE_PREFIXES = _build_country_code_prefixes()
+
+
+def _parse_e164(raw_phone: str) -> Optional[PhoneNumber]:
+    """Build a :class:`PhoneNumber` for clean ``+<cc><number>`` input.
+
+    This avoids :func:`phonenumbers.parse` for numbers that are already in
+    international form. ``None`` means the caller must fall back to a full
+    parse (not E.164, unknown country code, or a national part with a
+    leading zero that ``parse`` would treat specially).
+    """
+    if not _E164_CANDIDATE.fullmatch(raw_phone):
+        return None
+    digits = _NON_DIGITS.sub("", raw_phone)
+    match = _COUNTRY_CODE_PREFIXES.get(digits[:3])
+    if match is None:
+        return None
+    country_code, length = match
+    national = digits[length:]
+    if not national or national[0] == "0":
+        return None
+    return PhoneNumber(country_code=country_code, national_number=int(national))
+
+
+def _is_valid(parsed: PhoneNumber, strict: bool = True) -> bool:
+    # is_possible_number is a cheap length check; is_valid_number matches the
+    # full numbering plan and is much slower, so it only runs in strict mode
+    if not phonenumbers.is_possible_number(parsed):
+        return False
+    return not strict or phonenumbers.is_valid_number(parsed)
+
 
 def process_phone_number(
-    raw_phone: str, default_region: str = "MX"
+    raw_phone: str, default_region: str = "MX", strict: bool = True
 ) -> Tuple[Optional[str], Optional[str]]:
     """Return international phone number formats for MX/US focused processing.
 
@@ -29,20 +101,31 @@ def process_phone_number(
     Args:
         raw_phone: Raw phone number string to process
         default_region: Default region (MX for Mexico, US for United States)
+        strict: When False, numbers only need to have a possible length for
+            their region instead of passing full ``is_valid_number`` checks
 
     Returns:
         Tuple of (formatted_number, alternative_format) or (None, None)
     """
+    return _process_phone_number_cached(raw_phone, default_region, strict)
 
-    try:
-        parsed: PhoneNumber = phonenumbers.parse(raw_phone, default_region)
-    except phonenumbers.NumberParseException:
-        return None, None
 
-    if not (
-        phonenumbers.is_possible_number(parsed) and phonenumbers.is_valid_number(parsed)
-    ):
-        return None, None
+@functools.lru_cache(maxsize=65536)
+def _process_phone_number_cached(
+    raw_phone: str, default_region: str, strict: bool
+) -> Tuple[Optional[str], Optional[str]]:
+    # vCards repeat the same raw number often; results are immutable strings.
+    # The E.164 fast path skips parse's national prefix stripping, which is
+    # only safe when the full validity check confirms the result.
+    parsed = _parse_e164(raw_phone) if strict else None
+    if parsed is None or not _is_valid(parsed, strict):
+        try:
+            parsed = phonenumbers.parse(raw_phone, default_region)
+        except phonenumbers.NumberParseException:
+            return None, None
+
+        if not _is_valid(parsed, strict):
+            return None, None
 
     original_formatted = phonenumbers.format_number(
         parsed, PhoneNumberFormat.INTERNATIONAL
@@ -77,14 +160,139 @@ def process_phone_number(
         elif len(subscriber) == 9:
             original_formatted = f"+55 {area} {subscriber[:5]}-{subscriber[5:]}"
             mod_digits = subscriber[1:]
-            _mod_number = phonenumbers.parse(f"+55{area}{mod_digits}", "BR")
             modified_formatted = f"+55 {area} {mod_digits[:4]}-{mod_digits[4:]}"
 
     return original_formatted, modified_formatted
 
 
+def _split_tel_line(line: str) -> Optional[Tuple[str, str]]:
+    """Return ``(prefix, number)`` for a TEL line, or ``None``.
+
+    Equivalent to matching :data:`_PHONE_PATTERN`, but the common case of a
+    single colon is handled with :meth:`str.partition` instead of the regex.
+    """
+    head, sep, tail = line.partition(":")
+    if sep and ":" not in tail:
+        type_index = head.find("TEL;TYPE=")
+        if head.endswith("TEL") or 0 <= type_index < len(head) - len("TEL;TYPE="):
+            return head, tail
+        return None
+    match = _PHONE_PATTERN.match(line)
+    if match:
+        return match.group("prefix"), match.group("number")
+    return None
+
+
+def _iter_tel_numbers(input_vcard: str) -> Iterator[str]:
+    """Yield the raw number of every TEL line in ``input_vcard``."""
+    with open(input_vcard, "r", encoding="utf-8") as fin:
+        for line in fin:
+            if "TEL" not in line:
+                continue
+            tel = _split_tel_line(line.rstrip("\n"))
+            if tel:
+                yield tel[1].strip()
+
+
+def _process_numbers_parallel(
+    raw_numbers: List[str], default_region: str, workers: int, strict: bool = True
+) -> Dict[str, Tuple[Optional[str], Optional[str]]]:
+    """Run :func:`process_phone_number` over ``raw_numbers`` in ``workers`` processes.
+
+    ``phonenumbers`` is pure Python and holds the GIL, so processes rather
+    than threads are needed to use more than one core.
+    """
+    chunksize = max(1, len(raw_numbers) // (workers * 4))
+    with ProcessPoolExecutor(max_workers=workers) as executor:
+        results = executor.map(
+            process_phone_number,
+            raw_numbers,
+            itertools.repeat(default_region),
+            itertools.repeat(strict),
+            chunksize=chunksize,
+        )
+        return dict(zip(raw_numbers, results))
+
+
+def _process_lines(
+    fin: TextIO,
+    fout: TextIO,
+    default_region: str,
+    strict: bool,
+    precomputed: Dict[str, Tuple[Optional[str], Optional[str]]],
+) -> None:
+    """Copy ``fin`` to ``fout``, rewriting TEL lines.
+
+    Numbers found in ``precomputed`` are not processed again.
+    """
+    for line in fin:
+        # Most vCard lines (FN, ADR, EMAIL, ...) cannot match; skip the regex
+        if "TEL" not in line:
+            fout.write(line)
+            continue
+        stripped_line = line.rstrip("\n")
+        tel = _split_tel_line(stripped_line)
+        if tel:
+            prefix, number = tel
+            raw_phone = number.strip()
+            if raw_phone in precomputed:
+                orig_formatted, mod_formatted = precomputed[raw_phone]
+            else:
+                orig_formatted, mod_formatted = process_phone_number(
+                    raw_phone, default_region, strict
+                )
+            if orig_formatted:
+                if "TYPE" in prefix:
+                    output_prefix = prefix
+                else:
+                    output_prefix = _TEL_CELL_PREFIX
+                fout.write(f"{output_prefix}:{orig_formatted}\n")
+            else:
+                fout.write(line)
+            if mod_formatted:
+                fout.write(f"{_TEL_CELL_PREFIX}:{mod_formatted}\n")
+        else:
+            fout.write(line)
+
+
+def process_vcard_stream(
+    fin: TextIO, fout: TextIO, default_region: str = "MX", strict: bool = True
+) -> None:
+    """Standardize the telephone entries of a vCard read from a text stream.
+
+    Same processing as :func:`process_vcard`, but works on any file-like
+    objects (e.g. :class:`io.StringIO`) and always runs in this process.
+
+    Args:
+        fin: Text stream to read the vCard from
+        fout: Text stream the processed vCard is written to
+        default_region: Default region for numbers without country code (MX/US)
+        strict: Passed to :func:`process_phone_number`
+    """
+    _process_lines(fin, fout, default_region, strict, {})
+
+
+def _write_vcard(
+    input_vcard: str,
+    output_vcard: str,
+    default_region: str,
+    strict: bool,
+    precomputed: Dict[str, Tuple[Optional[str], Optional[str]]],
+) -> None:
+    """Write the normalized copy of ``input_vcard`` to ``output_vcard``."""
+    with (
+        open(input_vcard, "r", encoding="utf-8", buffering=_IO_BUFFER_SIZE) as fin,
+        open(output_vcard, "w", encoding="utf-8", buffering=_IO_BUFFER_SIZE) as fout,
+    ):
+        _process_lines(fin, fout, default_region, strict, precomputed)
+
+
 def process_vcard(
-    input_vcard: str, output_vcard: str, default_region: str = "MX"
+    input_vcard: str,
+    output_vcard: str,
+    default_region: str = "MX",
+    workers: int = 1,
+    strict: bool = True,
 ) -> None:
     """
     Process a VCARD file to standardize telephone entries for MX/US numbers.
@@ -94,47 +302,47 @@ def process_vcard(
     - Adds legacy Brazilian number compatibility when needed
     - Standardizes TEL field formatting in vCard entries
 
+    ``input_vcard`` and ``output_vcard`` may be the same file; the output is
+    then written to a temporary file that replaces the input once complete.
+
     Args:
         input_vcard: Path to input vCard file
         output_vcard: Path to output processed vCard file
         default_region: Default region for numbers without country code (MX/US)
+        workers: Number of processes used to normalize numbers. With more than
+            one, TEL values are collected in a first pass and processed in a
+            process pool before the output is written.
+        strict: Passed to :func:`process_phone_number`; ``False`` skips the
+            slow ``is_valid_number`` check.
     """
-    with open(input_vcard, "r", encoding="utf-8") as file:
-        lines = file.readlines()
-
-    output_lines = []
+    precomputed: Dict[str, Tuple[Optional[str], Optional[str]]] = {}
+    if workers > 1:
+        # Each worker has its own lru_cache, so deduplicate before dispatching
+        unique_numbers = list(dict.fromkeys(_iter_tel_numbers(input_vcard)))
+        precomputed = _process_numbers_parallel(
+            unique_numbers, default_region, workers, strict
+        )
 
-    # Regex to capture any telephone line.
-    # It matches lines starting with "TEL:" or "TEL;TYPE=..." or with prefixes like "item1.TEL:".
-    phone_pattern = re.compile(r"^(?P<prefix>.*TEL(?:;TYPE=[^:]+)?):(?P<number>.*)$")
+    target = os.path.realpath(output_vcard)
+    if os.path.realpath(input_vcard) != target:
+        _write_vcard(input_vcard, output_vcard, default_region, strict, precomputed)
+        return
 
-    for line in lines:
-        stripped_line = line.rstrip("\n")
-        match = phone_pattern.match(stripped_line)
-        if match:
-            raw_phone = match.group("number").strip()
-            orig_formatted, mod_formatted = process_phone_number(
-                raw_phone, default_region
-            )
-            if orig_formatted:
-                prefix = match.group("prefix")
-                if "TYPE" in prefix:
-                    output_prefix = prefix
-                else:
-                    output_prefix = "TEL;TYPE=CELL"
-                output_lines.append(f"{output_prefix}:{orig_formatted}\n")
-            else:
-                output_lines.append(line)
-            if mod_formatted:
-                output_lines.append(f"TEL;TYPE=CELL:{mod_formatted}\n")
-        else:
-            output_lines.append(line)
-
-    with open(output_vcard, "w", encoding="utf-8") as file:
-        file.writelines(output_lines)
+    # The input is read while the output is written, so write next to it
+    # and swap the finished file in
+    fd, temp_path = tempfile.mkstemp(dir=os.path.dirname(target), suffix=".vcf")
+    os.close(fd)
+    try:
+        _write_vcard(input_vcard, temp_path, default_region, strict, precomputed)
+        shutil.copymode(target, temp_path)
+        os.replace(temp_path, target)
+    except BaseException:
+        os.unlink(temp_path)
+        raise
 
 
-if __name__ == "__main__":
+def main(argv: Optional[List[str]] = None) -> None:
+    """Command-line entry point; ``argv`` defaults to ``sys.argv[1:]``."""
     parser = argparse.ArgumentParser(
         description=(
             "Process a VCARD file to standardize telephone entries for international "
@@ -143,13 +351,35 @@ if __name__ == "__main__":
         )
     )
     parser.add_argument("input_vcard", type=str, help="Input VCARD file")
-    parser.add_argument("output_vcard", type=str, help="Output VCARD file")
+    parser.add_argument(
+        "output_vcard",
+        type=str,
+        help="Output VCARD file (may be the input file to update it in place)",
+    )
     parser.add_argument(
         "--region",
         default="MX",
         help="Default region for numbers without country code (MX=Mexico, US=United States, or any ISO 3166-1 alpha-2 code)",
     )
-    args = parser.parse_args()
+    parser.add_argument(
+        "--workers",
+        type=int,
+        default=1,
+        help="Number of processes used to normalize phone numbers (default: 1)",
+    )
+    parser.add_argument(
+        "--no-strict",
+        dest="strict",
+        action="store_false",
+        help="Only require numbers to have a possible length instead of full validation (faster)",
+    )
+    args = parser.parse_args(argv)
 
-    process_vcard(args.input_vcard, args.output_vcard, args.region)
+    process_vcard(
+        args.input_vcard, args.output_vcard, args.region, args.workers, args.strict
+    )
     print(f"VCARD processed and saved to {args.output_vcard}")
+
+
+if __name__ == "__main__":
+    main()
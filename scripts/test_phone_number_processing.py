@@ -0,0 +1,181 @@
+"""Tests for the vCard phone number normalization script."""
+
+import io
+
+import pytest
+
+pytest.importorskip("phonenumbers")
+
+import phone_number_processing
+from phone_number_processing import (
+    main,
+    process_phone_number,
+    process_vcard,
+    process_vcard_stream,
+)
+
+# One entry per distinct raw input; results are memoized, so repeating an
+# input would only exercise the cache
+PHONE_CASES = [
+    ("+52 662 340 2020", "MX", ("+52 662 340 2020", None)),
+    ("662 340 2020", "MX", ("+52 662 340 2020", None)),
+    ("(55) 1234 5678", "MX", ("+52 55 1234 5678", None)),
+    ("650-253-0000", "US", ("+1 650-253-0000", None)),
+    ("+1 650-253-0000 ext123", "MX", ("+1 650-253-0000 ext. 123", None)),
+    ("+55 11 91234-5678", "MX", ("+55 11 91234-5678", "+55 11 1234-5678")),
+    ("+55 11 3456-7890", "MX", ("+55 11 3456-7890", None)),
+    ("+44 20 7946 0958", "MX", ("+44 20 7946 0958", None)),
+    ("12", "MX", (None, None)),
+    ("not a number", "MX", (None, None)),
+]
+
+VCARD_CASES = [
+    pytest.param(
+        "BEGIN:VCARD\nVERSION:3.0\nFN:Ana\nTEL:662 340 2020\nEND:VCARD\n",
+        "BEGIN:VCARD\nVERSION:3.0\nFN:Ana\nTEL;TYPE=CELL:+52 662 340 2020\nEND:VCARD\n",
+        id="mx-national",
+    ),
+    pytest.param(
+        "BEGIN:VCARD\nFN:Bob\nTEL;TYPE=WORK:+1 650-253-0000\nEND:VCARD\n",
+        "BEGIN:VCARD\nFN:Bob\nTEL;TYPE=WORK:+1 650-253-0000\nEND:VCARD\n",
+        id="us-keeps-type",
+    ),
+    pytest.param(
+        "BEGIN:VCARD\nFN:Caio\nitem1.TEL:+55 11 91234-5678\nEND:VCARD\n",
+        "BEGIN:VCARD\nFN:Caio\nTEL;TYPE=CELL:+55 11 91234-5678\n"
+        "TEL;TYPE=CELL:+55 11 1234-5678\nEND:VCARD\n",
+        id="br-legacy-mobile",
+    ),
+    pytest.param(
+        "BEGIN:VCARD\nFN:Invalid\nTEL:12\nEND:VCARD\n",
+        "BEGIN:VCARD\nFN:Invalid\nTEL:12\nEND:VCARD\n",
+        id="invalid-unchanged",
+    ),
+]
+
+
+@pytest.mark.parametrize("raw_phone, region, expected", PHONE_CASES)
+def test_process_phone_number(raw_phone, region, expected):
+    assert process_phone_number(raw_phone, region) == expected
+
+
+def test_process_phone_number_lenient():
+    # Possible length for MX but not an assigned number range
+    raw_phone = "+52 100 000 0000"
+    assert process_phone_number(raw_phone) == (None, None)
+    assert process_phone_number(raw_phone, strict=False)[0] is not None
+
+
+@pytest.mark.parametrize(
+    "raw_phone, expected",
+    [
+        # parse strips a national prefix here, so the digits change
+        ("+375 88955176", "+375 8955176"),
+        ("+261 2114350", "+261 20 21 143 50"),
+    ],
+)
+def test_process_phone_number_lenient_strips_national_prefix(raw_phone, expected):
+    assert process_phone_number(raw_phone, strict=False) == (expected, None)
+
+
+@pytest.mark.parametrize("vcard, expected", VCARD_CASES)
+def test_process_vcard_stream(vcard, expected):
+    output = io.StringIO()
+    process_vcard_stream(io.StringIO(vcard), output)
+    assert output.getvalue() == expected
+
+
+def test_process_vcard_files(tmp_path):
+    vcard = "BEGIN:VCARD\nFN:Ana\nTEL:662 340 2020\nEND:VCARD\n"
+    input_path = tmp_path / "in.vcf"
+    output_path = tmp_path / "out.vcf"
+    input_path.write_text(vcard, encoding="utf-8")
+
+    process_vcard(str(input_path), str(output_path))
+
+    output = io.StringIO()
+    process_vcard_stream(io.StringIO(vcard), output)
+    assert output_path.read_text(encoding="utf-8") == output.getvalue()
+
+
+@pytest.mark.parametrize("workers", [1, 2])
+def test_process_vcard_in_place(tmp_path, workers):
+    vcard = "BEGIN:VCARD\nFN:Ana\nTEL:662 340 2020\nEND:VCARD\n"
+    path = tmp_path / "contacts.vcf"
+    path.write_text(vcard, encoding="utf-8")
+    path.chmod(0o640)
+
+    process_vcard(str(path), str(path), workers=workers)
+
+    expected = io.StringIO()
+    process_vcard_stream(io.StringIO(vcard), expected)
+    assert path.read_text(encoding="utf-8") == expected.getvalue()
+    assert path.stat().st_mode & 0o777 == 0o640
+    assert [p.name for p in tmp_path.iterdir()] == ["contacts.vcf"]
+
+
+def test_main_argument_handling(tmp_path, capsys):
+    input_path = tmp_path / "in.vcf"
+    output_path = tmp_path / "out.vcf"
+    input_path.write_text(
+        "BEGIN:VCARD\nFN:Bob\nTEL:650-253-0000\nEND:VCARD\n", encoding="utf-8"
+    )
+
+    with pytest.raises(SystemExit):
+        main([str(input_path)])
+
+    main([str(input_path), str(output_path), "--region", "US"])
+    assert "TEL;TYPE=CELL:+1 650-253-0000" in output_path.read_text(encoding="utf-8")
+    assert str(output_path) in capsys.readouterr().out
+
+
+@pytest.mark.parametrize("strict", [True, False])
+def test_process_vcard_workers_matches_sequential(tmp_path, monkeypatch, strict):
+    input_path = tmp_path / "in.vcf"
+    input_path.write_text(
+        "BEGIN:VCARD\nFN:Ana\nTEL:662 340 2020\nTEL;TYPE=CELL:+52 1 662 340 2021\n"
+        "END:VCARD\nBEGIN:VCARD\nFN:Bob\nTEL:650-253-0000\nTEL:12\n"
+        "TEL:+55 11 91234-5678\nEND:VCARD\nBEGIN:VCARD\nFN:Eve\n"
+        "TEL:662 340 2020\nEND:VCARD\n",
+        encoding="utf-8",
+    )
+    sequential = tmp_path / "sequential.vcf"
+    parallel = tmp_path / "parallel.vcf"
+
+    batches = []
+    process_numbers_parallel = phone_number_processing._process_numbers_parallel
+
+    def record_batch(raw_numbers, *args):
+        batches.append(raw_numbers)
+        return process_numbers_parallel(raw_numbers, *args)
+
+    monkeypatch.setattr(
+        phone_number_processing, "_process_numbers_parallel", record_batch
+    )
+
+    process_vcard(str(input_path), str(sequential), strict=strict)
+    process_vcard(str(input_path), str(parallel), workers=2, strict=strict)
+
+    # Duplicates are collapsed before the numbers go to the process pool
+    assert len(batches) == 1 and len(batches[0]) == 5
+
+    assert parallel.read_text(encoding="utf-8") == sequential.read_text(
+        encoding="utf-8"
+    )
+
+
+def test_main_workers(tmp_path):
+    input_path = tmp_path / "in.vcf"
+    input_path.write_text(
+        "BEGIN:VCARD\nFN:Bob\nTEL:650-253-0000\nTEL:650-253-0001\nEND:VCARD\n",
+        encoding="utf-8",
+    )
+    sequential = tmp_path / "sequential.vcf"
+    parallel = tmp_path / "parallel.vcf"
+
+    main([str(input_path), str(sequential), "--region", "US"])
+    main([str(input_path), str(parallel), "--region", "US", "--workers", "2"])
+
+    assert parallel.read_text(encoding="utf-8") == sequential.read_text(
+        encoding="utf-8"
+    )